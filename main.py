@@ -1,11 +1,16 @@
+import itertools
 import random
+import re
 import time
 import os
 import math
 from enum import Enum
+from operator import attrgetter
 import sys
 import curses
-from collections import defaultdict
+import heapq
+from array import array
+from collections import Counter, namedtuple
 
 
 class OrderState(Enum):
@@ -46,122 +51,226 @@ class MiniPuzzleType(Enum):
     QUANTUM_STATE = "Quantum State Manipulation"
 
 
+# Enum members as tuples, so random picks don't rebuild a member list each time
+_DISH_TYPES = tuple(DishType)
+_RESOURCE_TYPES = tuple(ResourceType)
+_MINI_PUZZLE_TYPES = tuple(MiniPuzzleType)
+_TIMELINE_EVENTS = tuple(TimelineEvent)
+
+# Resource amounts are fixed-order sequences indexed by these constants
+QE, PS, TT = 0, 1, 2
+_RESOURCE_NAMES = tuple(resource.value for resource in _RESOURCE_TYPES)
+
+# ANSI "clear screen, cursor home"; an empty os.system call turns on VT processing on Windows 10+
+_CLEAR = "\x1b[2J\x1b[H"
+if os.name == "nt":
+    os.system("")
+
+
+def _clear_screen():
+    sys.stdout.write(_CLEAR)
+    sys.stdout.flush()
+
+
+def _write_frame(parts):
+    # Phase screens are assembled in full and written in one go, so the terminal never shows a half-drawn frame
+    sys.stdout.write("".join(parts))
+    sys.stdout.flush()
+
+
+# Quantities derived from the day number; daily_resources is indexed like the resources
+_DayParams = namedtuple(
+    "_DayParams",
+    "num_orders time_limit_max difficulty timeline_count max_active_orders daily_resources"
+)
+
+
+def _compute_day_params(day):
+    return _DayParams(
+        num_orders=3 + min(day // 2, 5),
+        time_limit_max=5 + min(day // 2, 5),
+        difficulty=min(1 + day // 3, 5),
+        timeline_count=min(2 + day // 3, 5),
+        max_active_orders=3 + min(day // 3, 4),
+        daily_resources=(5 + day // 2, 2 + day // 3, 1 + day // 4)
+    )
+
+
+# Probability bonus granted for solving an order's mini-puzzle
+PUZZLE_BONUS_PROBABILITY = 0.2
+
+
+def cumulative_probabilities(probabilities):
+    # Running totals for random.choices(cum_weights=...); the last entry is pinned to 1.0 so a draw can never overshoot
+    cumulative = list(itertools.accumulate(probabilities))
+    cumulative[-1] = 1.0
+    return cumulative
+
+
 class Order:
-    def __init__(self, day):
-        self.id = random.randint(1000, 9999)
+    __slots__ = (
+        "id", "state", "dish", "time_limit", "time_remaining", "difficulty", "resource_requirements", "reward",
+        "puzzle", "possible_outcomes", "_outcome_probs", "_cum", "_cum_bonus", "actual_outcome", "timeline",
+        "_str_cache", "_str_cache_key", "_details_cache", "_details_cache_key", "_satisfaction"
+    )
+
+    def __init__(self, params, fields=None):
+        # params is the day's _DayParams; random fields come from draw_fields unless a batch already drew them
+        if fields is None:
+            fields = {name: column[0] for name, column in self.draw_fields(params, 1).items()}
+
+        self.id = fields["id"]
         self.state = OrderState.SUPERPOSITION
-        self.dish = random.choice(list(DishType))
-        self.time_limit = random.randint(3, 5 + min(day // 2, 5))
+        self.dish = fields["dish"]
+        self.time_limit = fields["time_limit"]
         self.time_remaining = self.time_limit
-        self.difficulty = min(1 + day // 3, 5)
-        self.resource_requirements = {
-            ResourceType.QUANTUM_ENERGY: random.randint(1, 1 + self.difficulty),
-            ResourceType.PROBABILITY_STABILIZER: random.randint(0, self.difficulty // 2),
-            ResourceType.TIMELINE_TOKEN: random.randint(0, 1 if self.difficulty > 2 else 0)
-        }
-        self.reward = sum(self.resource_requirements.values()) * 10 + self.difficulty * 5
-        self.puzzle = random.choice(list(MiniPuzzleType))
-        self.possible_outcomes = self.generate_possible_outcomes()
+        self.difficulty = params.difficulty
+        self.resource_requirements = (fields["quantum_energy"], fields["probability_stabilizer"], fields["timeline_token"])
+        self.reward = sum(self.resource_requirements) * 10 + self.difficulty * 5
+        self.puzzle = fields["puzzle"]
+        self.possible_outcomes, self._outcome_probs = self.generate_possible_outcomes(fields["num_outcomes"])
+        # Cumulative probabilities are precomputed for the plain and puzzle bonus collapses
+        self._cum = cumulative_probabilities(self._outcome_probs)
+        self._cum_bonus = cumulative_probabilities(self._apply_bonus(PUZZLE_BONUS_PROBABILITY))
         self.actual_outcome = None
-        self.timeline = random.randint(1, min(2 + day // 3, 5))
+        self._satisfaction = 0  # Final satisfaction, set on delivery for ranking
+        self.timeline = fields["timeline"]
+        self._str_cache = None
+        self._str_cache_key = None
+        self._details_cache = None
+        self._details_cache_key = None
+
+    @staticmethod
+    def draw_fields(params, count):
+        # Draw every random field for `count` orders at once, as parallel lists
+        difficulty = params.difficulty
+        return {
+            "id": random.choices(range(1000, 10000), k=count),
+            "dish": random.choices(_DISH_TYPES, k=count),
+            "time_limit": random.choices(range(3, params.time_limit_max + 1), k=count),
+            "quantum_energy": random.choices(range(1, 2 + difficulty), k=count),
+            "probability_stabilizer": random.choices(range(0, 1 + difficulty // 2), k=count),
+            "timeline_token": random.choices(range(0, 2 if difficulty > 2 else 1), k=count),
+            "puzzle": random.choices(_MINI_PUZZLE_TYPES, k=count),
+            "num_outcomes": random.choices(range(2, 5), k=count),
+            "timeline": random.choices(range(1, params.timeline_count + 1), k=count)
+        }
 
-    def generate_possible_outcomes(self):
-        # Generate 2-4 possible outcomes for the order
+    @classmethod
+    def from_arrays(cls, params, i, arrays):
+        # Build the i-th order of a batch returned by draw_fields
+        return cls(params, {name: column[i] for name, column in arrays.items()})
+
+    def generate_possible_outcomes(self, num_outcomes):
+        # Generate 2-4 possible outcomes for the order, with their probabilities kept separately
         outcomes = []
-        num_outcomes = random.randint(2, 4)
+        weights = []
 
         # One perfect outcome
         perfect = {
             "description": f"Perfect {self.dish.value}",
             "satisfaction": 100,
-            "reward_multiplier": 1.5,
-            "probability": 0.2 + (0.1 * self.difficulty)  # Higher difficulty increases perfect probability
+            "reward_multiplier": 1.5
         }
         outcomes.append(perfect)
+        weights.append(0.2 + (0.1 * self.difficulty))  # Higher difficulty increases perfect probability
 
         # One good outcome
         good = {
             "description": f"Good {self.dish.value}",
             "satisfaction": 80,
-            "reward_multiplier": 1.0,
-            "probability": 0.4
+            "reward_multiplier": 1.0
         }
         outcomes.append(good)
+        weights.append(0.4)
 
         # Possibly a mediocre outcome
         if num_outcomes > 2:
             mediocre = {
                 "description": f"Mediocre {self.dish.value}",
                 "satisfaction": 50,
-                "reward_multiplier": 0.7,
-                "probability": 0.3
+                "reward_multiplier": 0.7
             }
             outcomes.append(mediocre)
+            weights.append(0.3)
 
         # Possibly a poor outcome
         if num_outcomes > 3:
             poor = {
                 "description": f"Poor {self.dish.value}",
                 "satisfaction": 20,
-                "reward_multiplier": 0.3,
-                "probability": 0.1
+                "reward_multiplier": 0.3
             }
             outcomes.append(poor)
+            weights.append(0.1)
 
         # Normalize probabilities
-        total_prob = sum(outcome["probability"] for outcome in outcomes)
-        for outcome in outcomes:
-            outcome["probability"] /= total_prob
+        total_prob = sum(weights)
+        return outcomes, tuple(weight / total_prob for weight in weights)
+
+    def _apply_bonus(self, bonus_probability):
+        # Shift probability towards outcomes with satisfaction >= 80, returning new normalized probabilities
+        num_worse = sum(1 for outcome in self.possible_outcomes if outcome["satisfaction"] < 80)
+        probabilities = []
+        for outcome, probability in zip(self.possible_outcomes, self._outcome_probs):
+            if outcome["satisfaction"] >= 80:
+                probabilities.append(probability + bonus_probability)
+            else:
+                probabilities.append(max(0.0, probability - bonus_probability / num_worse))
 
-        return outcomes
+        total_prob = sum(probabilities)
+        return [probability / total_prob for probability in probabilities]
 
     def collapse_state(self, bonus_probability=0):
         # Collapse the quantum state into a definite outcome
-        if self.state != OrderState.SUPERPOSITION:
+        if self.state is not OrderState.SUPERPOSITION:
             return
 
-        # Modified probabilities based on bonus
-        modified_outcomes = self.possible_outcomes.copy()
-        if bonus_probability > 0:
-            # Increase probability of better outcomes
-            for outcome in modified_outcomes:
-                if outcome["satisfaction"] >= 80:
-                    outcome["probability"] += bonus_probability
-                else:
-                    outcome["probability"] -= bonus_probability / (len(modified_outcomes) - 2)
-
-            # Re-normalize
-            total_prob = sum(outcome["probability"] for outcome in modified_outcomes)
-            for outcome in modified_outcomes:
-                outcome["probability"] /= total_prob
+        # Pick the cumulative probabilities for this bonus; the puzzle bonus case is precomputed
+        if bonus_probability <= 0:
+            cumulative = self._cum
+        elif bonus_probability == PUZZLE_BONUS_PROBABILITY:
+            cumulative = self._cum_bonus
+        else:
+            cumulative = cumulative_probabilities(self._apply_bonus(bonus_probability))
 
         # Select outcome based on probabilities
-        rand = random.random()
-        cumulative_prob = 0
-        for outcome in modified_outcomes:
-            cumulative_prob += outcome["probability"]
-            if rand <= cumulative_prob:
-                self.actual_outcome = outcome
-                break
+        self.actual_outcome = random.choices(self.possible_outcomes, cum_weights=cumulative, k=1)[0]
 
         self.state = OrderState.COLLAPSED
 
     def update_time(self):
         self.time_remaining -= 1
-        if self.time_remaining <= 0 and self.state == OrderState.SUPERPOSITION:
+        if self.time_remaining <= 0 and self.state is OrderState.SUPERPOSITION:
             self.state = OrderState.FAILED
             return True
         return False
 
+    def _render_key(self):
+        # Only the state, timer and timeline change after creation (the kitchen also sets them directly),
+        # so cached renders stay valid while this key matches
+        return self.state, self.time_remaining, self.timeline
+
     def __str__(self):
+        key = self._render_key()
+        if key == self._str_cache_key:
+            return self._str_cache
+
         status = f"Order #{self.id}: {self.dish.value} - {self.state.value}"
-        if self.state == OrderState.SUPERPOSITION:
+        if self.state is OrderState.SUPERPOSITION:
             status += f" (Time: {self.time_remaining}/{self.time_limit}, Timeline: {self.timeline})"
-        elif self.state == OrderState.COLLAPSED:
+        elif self.state is OrderState.COLLAPSED:
             status += f" - {self.actual_outcome['description']} (Satisfaction: {self.actual_outcome['satisfaction']}%)"
+
+        self._str_cache = status
+        self._str_cache_key = key
         return status
 
     def get_details(self):
+        key = self._render_key()
+        if key == self._details_cache_key:
+            return self._details_cache
+
         details = [
             f"Order #{self.id}: {self.dish.value}",
             f"State: {self.state.value}",
@@ -172,23 +281,33 @@ class Order:
             "Resource Requirements:"
         ]
 
-        for resource, amount in self.resource_requirements.items():
+        for name, amount in zip(_RESOURCE_NAMES, self.resource_requirements):
             if amount > 0:
-                details.append(f"  - {resource.value}: {amount}")
+                details.append(f"  - {name}: {amount}")
 
         details.append(f"Base Reward: {self.reward} points")
 
-        if self.state == OrderState.SUPERPOSITION:
+        if self.state is OrderState.SUPERPOSITION:
             details.append("\nPossible Outcomes:")
-            for outcome in self.possible_outcomes:
+            for outcome, probability in zip(self.possible_outcomes, self._outcome_probs):
                 details.append(
-                    f"  - {outcome['description']} (Satisfaction: {outcome['satisfaction']}%, Probability: {outcome['probability']:.1%})")
-        elif self.state == OrderState.COLLAPSED:
+                    f"  - {outcome['description']} (Satisfaction: {outcome['satisfaction']}%, Probability: {probability:.1%})")
+        elif self.state is OrderState.COLLAPSED:
             details.append(f"\nOutcome: {self.actual_outcome['description']}")
             details.append(f"Satisfaction: {self.actual_outcome['satisfaction']}%")
             details.append(f"Reward Multiplier: {self.actual_outcome['reward_multiplier']}x")
 
-        return "\n".join(details)
+        self._details_cache = "\n".join(details)
+        self._details_cache_key = key
+        return self._details_cache
+
+
+# Single-qubit gate results as (state, operation) -> state, ignoring global phase
+_QUANTUM_TRANSITIONS = {
+    ("|0⟩", "X"): "|1⟩", ("|1⟩", "X"): "|0⟩", ("|+⟩", "X"): "|+⟩", ("|-⟩", "X"): "|-⟩",
+    ("|0⟩", "Z"): "|0⟩", ("|1⟩", "Z"): "|1⟩", ("|+⟩", "Z"): "|-⟩", ("|-⟩", "Z"): "|+⟩",
+    ("|0⟩", "H"): "|+⟩", ("|1⟩", "H"): "|-⟩", ("|+⟩", "H"): "|0⟩", ("|-⟩", "H"): "|1⟩"
+}
 
 
 class MiniPuzzle:
@@ -205,11 +324,9 @@ class MiniPuzzle:
             self.solution = self.sequence.copy()
             # Remove some numbers
             removals = min(length - 2, self.difficulty + 1)
-            for _ in range(removals):
-                idx = random.randint(0, len(self.sequence) - 1)
-                while self.sequence[idx] is None:
-                    idx = random.randint(0, len(self.sequence) - 1)
+            for idx in random.sample(range(length), removals):
                 self.sequence[idx] = None
+            self._missing_count = removals
 
         elif self.type == MiniPuzzleType.PATTERN:
             patterns = [
@@ -220,23 +337,19 @@ class MiniPuzzle:
             ]
             self.pattern = random.choice(patterns)
             length = 4 + self.difficulty * 2
-            self.sequence = []
 
             # Generate a sequence with a pattern
-            while len(self.sequence) < length:
-                self.sequence.extend(self.pattern)
-            self.sequence = self.sequence[:length]
+            repeat = -(-length // len(self.pattern))
+            self.sequence = (self.pattern * repeat)[:length]
 
             # Store the solution
             self.solution = self.sequence.copy()
 
             # Remove some elements
             removals = min(length - 4, self.difficulty * 2)
-            for _ in range(removals):
-                idx = random.randint(0, len(self.sequence) - 1)
-                while self.sequence[idx] is None:
-                    idx = random.randint(0, len(self.sequence) - 1)
+            for idx in random.sample(range(length), removals):
                 self.sequence[idx] = None
+            self._missing_count = removals
 
         elif self.type == MiniPuzzleType.PROBABILITY:
             # For probability calculation, we'll give a simple word problem
@@ -257,24 +370,10 @@ class MiniPuzzle:
             self.initial_state = random.choice(states)
             self.operations = [random.choice(operations) for _ in range(num_operations)]
 
-            # Determine the final state (simplified)
-            if self.initial_state == "|0⟩":
-                final_state = "|0⟩"
-                for op in self.operations:
-                    if op == "X":
-                        final_state = "|1⟩" if final_state == "|0⟩" else "|0⟩"
-                    elif op == "H":
-                        final_state = "|+⟩" if final_state == "|0⟩" else "|-⟩"
-            elif self.initial_state == "|1⟩":
-                final_state = "|1⟩"
-                for op in self.operations:
-                    if op == "X":
-                        final_state = "|0⟩" if final_state == "|1⟩" else "|1⟩"
-                    elif op == "H":
-                        final_state = "|-⟩" if final_state == "|1⟩" else "|+⟩"
-            else:
-                # For simplified puzzles, just alternate between |+⟩ and |-⟩
-                final_state = "|+⟩" if len(self.operations) % 2 == 0 else "|-⟩"
+            # Determine the final state
+            final_state = self.initial_state
+            for op in self.operations:
+                final_state = _QUANTUM_TRANSITIONS[(final_state, op)]
 
             self.question = f"If we start with {self.initial_state} and apply the operations {' '.join(self.operations)}, what's the final state?"
             self.answer = final_state
@@ -312,7 +411,7 @@ class MiniPuzzle:
     def check_solution(self, user_answer):
         if self.type == MiniPuzzleType.SEQUENCE or self.type == MiniPuzzleType.PATTERN:
             # For sequence/pattern, user_answer should be a list of answers to fill in
-            if len(user_answer) != self.sequence.count(None):
+            if len(user_answer) != self._missing_count:
                 return False
 
             answer_idx = 0
@@ -332,8 +431,7 @@ class MiniPuzzle:
 
     def get_solution_format(self):
         if self.type == MiniPuzzleType.SEQUENCE or self.type == MiniPuzzleType.PATTERN:
-            missing_count = self.sequence.count(None)
-            return f"Enter {missing_count} values separated by spaces"
+            return f"Enter {self._missing_count} values separated by spaces"
         elif self.type == MiniPuzzleType.PROBABILITY:
             return "Enter the probability as a fraction (e.g., 1/6)"
         elif self.type == MiniPuzzleType.QUANTUM_STATE:
@@ -341,11 +439,11 @@ class MiniPuzzle:
 
     def parse_user_input(self, user_input):
         if self.type == MiniPuzzleType.SEQUENCE:
-            try:
-                # Parse input as a list of integers
-                return [int(x) for x in user_input.split()]
-            except ValueError:
+            # Parse input as a list of integers, rejecting anything else up front
+            tokens = user_input.split()
+            if not all((token[1:] if token[0] in "+-" else token).isdecimal() for token in tokens):
                 return None
+            return list(map(int, tokens))
         elif self.type == MiniPuzzleType.PATTERN:
             # Return input as a list of strings
             return user_input.split()
@@ -355,20 +453,56 @@ class MiniPuzzle:
 
 
 class KuantumKitchen:
+    __slots__ = (
+        "day", "_day_params", "resources", "active_orders", "completed_orders", "failed_orders", "score",
+        "customer_satisfaction", "reality_stability", "timelines", "_timeline_labels",
+        "current_phase", "max_active_orders", "available_orders", "special_events", "kitchen_units",
+        "_kitchen_units_line", "tutorial_shown", "_planning_handlers", "_planning_prefix", "_exec_handlers",
+        "_exec_prefix", "_delivery_handlers", "_delivery_prefix", "_superposition_count"
+    )
+
+    # Command grammar: a verb ("va" or one letter) followed by an optional order number
+    _CMD_RE = re.compile(r"(va|[a-z])\s*([+-]?\d+)?")
+
+    # Command help for each phase, appended as-is to every redraw
+    _PLANNING_COMMANDS = (
+        "\n===== PLANNING PHASE COMMANDS =====\n"
+        "[a#] Accept order # (e.g., a1)\n"
+        "[r#] Reject order # (e.g., r1)\n"
+        "[v#] View order details # (e.g., v1)\n"
+        "[n] Proceed to Execution Phase\n"
+        "[q] Quit game\n"
+    )
+    _EXECUTION_COMMANDS = (
+        "\n===== EXECUTION PHASE COMMANDS =====\n"
+        "[p#] Prepare order # (e.g., p1)\n"
+        "[v#] View order details # (e.g., v1)\n"
+        "[t] Update time (advances time by 1 unit)\n"
+        "[n] Proceed to Delivery Phase\n"
+        "[q] Quit game\n"
+    )
+    _DELIVERY_COMMANDS = (
+        "\n===== DELIVERY PHASE COMMANDS =====\n"
+        "[d#] Deliver order # (e.g., d1)\n"
+        "[v#] View order details # (e.g., v1)\n"
+        "[n] End day and proceed to next day\n"
+        "[q] Quit game\n"
+    )
+
     def __init__(self):
         self.day = 1
-        self.resources = {
-            ResourceType.QUANTUM_ENERGY: 10,
-            ResourceType.PROBABILITY_STABILIZER: 5,
-            ResourceType.TIMELINE_TOKEN: 2
-        }
+        self._day_params = _compute_day_params(self.day)
+        self.resources = array("l", [10, 5, 2])  # Indexed by QE, PS, TT
         self.active_orders = []
+        self._superposition_count = 0  # Active orders still waiting to be prepared
         self.completed_orders = []
         self.failed_orders = []
         self.score = 0
         self.customer_satisfaction = 50  # Starting satisfaction level (%)
         self.reality_stability = 100  # Starting reality stability
-        self.timelines = defaultdict(list)  # Tracks orders in each timeline
+        # Tracks orders in each occupied timeline; the inner dicts are insertion-ordered sets (values unused)
+        self.timelines = {}
+        self._timeline_labels = {}  # Rendered "#id, #id" order lists, dropped when a timeline changes
         self.current_phase = "Planning"
         self.max_active_orders = 3
         self.available_orders = []
@@ -378,14 +512,25 @@ class KuantumKitchen:
             "Probability Oven": 1,
             "Timeline Grill": 1
         }
+        # Kitchen units never change during a game, so render their status line once
+        self._kitchen_units_line = f"Kitchen Units: {', '.join(f'{unit} (x{count})' for unit, count in self.kitchen_units.items())}"
         self.tutorial_shown = False
 
+        # Command dispatch tables for each phase: exact commands, and commands taking an order number
+        self._planning_handlers = {'q': self._cmd_quit, 'n': self._cmd_planning_next}
+        self._planning_prefix = {
+            'a': self._cmd_accept, 'r': self._cmd_reject, 'v': self._cmd_view_available, 'va': self._cmd_view_active
+        }
+        self._exec_handlers = {'q': self._cmd_quit, 'n': self._cmd_exec_next, 't': self._cmd_tick}
+        self._exec_prefix = {'p': self._cmd_prepare, 'v': self._cmd_view_active}
+        self._delivery_handlers = {'q': self._cmd_quit, 'n': self._cmd_delivery_next}
+        self._delivery_prefix = {'d': self._cmd_deliver, 'v': self._cmd_view_active}
+
     def generate_orders(self):
         # Generate new available orders based on day and current game state
-        num_orders = 3 + min(self.day // 2, 5)
-        self.available_orders = []
-        for _ in range(num_orders):
-            self.available_orders.append(Order(self.day))
+        num_orders = self._day_params.num_orders
+        arrays = Order.draw_fields(self._day_params, num_orders)
+        self.available_orders = [Order.from_arrays(self._day_params, i, arrays) for i in range(num_orders)]
 
     def accept_order(self, order_idx):
         if order_idx < 0 or order_idx >= len(self.available_orders):
@@ -399,7 +544,8 @@ class KuantumKitchen:
 
         # Remove from available and add to active
         self.active_orders.append(order)
-        self.timelines[order.timeline].append(order)
+        self._superposition_count += 1
+        self._add_to_timeline(order)
         self.available_orders.pop(order_idx)
         return True, f"Accepted order #{order.id}"
 
@@ -419,27 +565,29 @@ class KuantumKitchen:
         order = self.active_orders[order_idx]
 
         # Check if order is in a valid state
-        if order.state != OrderState.SUPERPOSITION:
+        if order.state is not OrderState.SUPERPOSITION:
             return False, f"Cannot prepare order in {order.state.value} state"
 
-        # Check if we have enough resources
-        for resource, amount in order.resource_requirements.items():
-            if self.resources[resource] < amount:
-                return False, f"Not enough {resource.value}"
+        # Check if we have enough resources, then consume them (the puzzle doesn't touch resources)
+        resources = self.resources
+        requirements = order.resource_requirements
+        if resources[QE] < requirements[QE] or resources[PS] < requirements[PS] or resources[TT] < requirements[TT]:
+            missing = next(idx for idx in (QE, PS, TT) if resources[idx] < requirements[idx])
+            return False, f"Not enough {_RESOURCE_NAMES[missing]}"
+        resources[QE] -= requirements[QE]
+        resources[PS] -= requirements[PS]
+        resources[TT] -= requirements[TT]
 
         # Start mini-puzzle for this order
         puzzle = MiniPuzzle(order)
         puzzle_completed = self.solve_puzzle(puzzle)
 
         # Player gets a probability bonus based on puzzle success
-        probability_bonus = 0.2 if puzzle_completed else 0
-
-        # Consume resources
-        for resource, amount in order.resource_requirements.items():
-            self.resources[resource] -= amount
+        probability_bonus = PUZZLE_BONUS_PROBABILITY if puzzle_completed else 0
 
         # Collapse the order's quantum state
         order.collapse_state(probability_bonus)
+        self._superposition_count -= 1
 
         # Update satisfaction based on outcome
         satisfaction_delta = (order.actual_outcome["satisfaction"] - 50) / 10
@@ -459,15 +607,15 @@ class KuantumKitchen:
 
         # Refund some resources based on outcome quality
         if order.actual_outcome["satisfaction"] >= 80:
-            refund_resource = random.choice(list(ResourceType))
+            refund_resource = random.randrange(len(resources))
             refund_amount = 1 + (1 if order.actual_outcome["satisfaction"] >= 90 else 0)
-            self.resources[refund_resource] += refund_amount
-            message += f" Gained {refund_amount} {refund_resource.value}!"
+            resources[refund_resource] += refund_amount
+            message += f" Gained {refund_amount} {_RESOURCE_NAMES[refund_resource]}!"
 
         return True, message
 
     def solve_puzzle(self, puzzle):
-        os.system('cls' if os.name == 'nt' else 'clear')
+        _clear_screen()
         print("\n===== QUANTUM KITCHEN MINI-PUZZLE =====")
         print(f"Order #{puzzle.order.id}: {puzzle.order.dish.value}")
         print(f"Puzzle Type: {puzzle.type.value}")
@@ -506,7 +654,7 @@ class KuantumKitchen:
         order = self.active_orders[order_idx]
 
         # Check if order is ready for delivery
-        if order.state != OrderState.COLLAPSED:
+        if order.state is not OrderState.COLLAPSED:
             return False, f"Cannot deliver order in {order.state.value} state"
 
         # Transfer from active to completed
@@ -514,42 +662,67 @@ class KuantumKitchen:
         self.completed_orders.append(order)
 
         # Remove from timeline
-        if order in self.timelines[order.timeline]:
-            self.timelines[order.timeline].remove(order)
+        self._remove_from_timeline(order)
 
         # Update order state
         order.state = OrderState.DELIVERED
+        order._satisfaction = order.actual_outcome["satisfaction"] if order.actual_outcome else 0
 
         # Give resources based on satisfaction
         resource_reward = order.actual_outcome["satisfaction"] // 20  # 0-5 resources
         if resource_reward > 0:
-            for _ in range(resource_reward):
-                resource = random.choice(list(ResourceType))
-                self.resources[resource] += 1
+            rewarded = Counter(random.choices(range(len(self.resources)), k=resource_reward))
+            for resource, amount in rewarded.items():
+                self.resources[resource] += amount
 
         return True, f"Delivered order #{order.id}. Customer satisfaction: {order.actual_outcome['satisfaction']}%"
 
+    def _add_to_timeline(self, order):
+        self.timelines.setdefault(order.timeline, {})[order] = None
+        self._timeline_labels.pop(order.timeline, None)
+
+    def _remove_from_timeline(self, order):
+        # Empty timelines are dropped, so the keys are exactly the occupied timelines
+        orders = self.timelines.get(order.timeline)
+        if orders is not None:
+            orders.pop(order, None)
+            if not orders:
+                del self.timelines[order.timeline]
+        self._timeline_labels.pop(order.timeline, None)
+
+    def _reset_timelines(self):
+        self.timelines = {}
+        self._timeline_labels.clear()
+
+    def _timeline_label(self, timeline):
+        label = self._timeline_labels.get(timeline)
+        if label is None:
+            label = ', #'.join(str(order.id) for order in self.timelines[timeline])
+            self._timeline_labels[timeline] = label
+        return label
+
     def update_time(self):
-        # Update time for all active orders
+        # Update time for all active orders, keeping the ones that have not expired
+        still_active = []
         expired_orders = []
 
+        superposition = OrderState.SUPERPOSITION
         for order in self.active_orders:
-            if order.state == OrderState.SUPERPOSITION:
-                if order.update_time():
-                    expired_orders.append(order)
-
-        # Handle expired orders
-        for order in expired_orders:
-            self.active_orders.remove(order)
-            self.failed_orders.append(order)
+            if order.state is superposition and order.update_time():
+                expired_orders.append(order)
+                self.failed_orders.append(order)
+                self._superposition_count -= 1
 
-            # Update customer satisfaction and reality stability
-            self.customer_satisfaction = max(0, self.customer_satisfaction - 5)
-            self.reality_stability = max(0, self.reality_stability - 5)
+                # Update customer satisfaction and reality stability
+                self.customer_satisfaction = max(0, self.customer_satisfaction - 5)
+                self.reality_stability = max(0, self.reality_stability - 5)
 
-            # Display message
-            print(f"Order #{order.id} has expired! Reality destabilized!")
+                # Display message
+                print(f"Order #{order.id} has expired! Reality destabilized!")
+            else:
+                still_active.append(order)
 
+        self.active_orders = still_active
         return len(expired_orders) > 0
 
     def advance_day(self):
@@ -558,13 +731,7 @@ class KuantumKitchen:
             self.trigger_special_event()
 
         # Restore some resources
-        daily_resources = {
-            ResourceType.QUANTUM_ENERGY: 5 + self.day // 2,
-            ResourceType.PROBABILITY_STABILIZER: 2 + self.day // 3,
-            ResourceType.TIMELINE_TOKEN: 1 + self.day // 4
-        }
-
-        for resource, amount in daily_resources.items():
+        for resource, amount in enumerate(self._day_params.daily_resources):
             self.resources[resource] += amount
 
         # Restore some reality stability
@@ -573,23 +740,24 @@ class KuantumKitchen:
 
         # Increment day
         self.day += 1
+        self._day_params = _compute_day_params(self.day)
 
         # Update max orders based on progress
-        self.max_active_orders = 3 + min(self.day // 3, 4)
+        self.max_active_orders = self._day_params.max_active_orders
 
         return f"Day {self.day} begins! Customer satisfaction: {self.customer_satisfaction}%. Reality stability: {self.reality_stability}%"
 
     def trigger_special_event(self):
-        event = random.choice(list(TimelineEvent))
+        event = random.choice(_TIMELINE_EVENTS)
         self.special_events.append(event)
 
         message = f"SPECIAL EVENT: {event.value}!"
 
         if event == TimelineEvent.RESOURCE_BOOST:
-            resource = random.choice(list(ResourceType))
+            resource = random.randrange(len(self.resources))
             amount = random.randint(2, 5)
             self.resources[resource] += amount
-            message += f" Gained {amount} {resource.value}!"
+            message += f" Gained {amount} {_RESOURCE_NAMES[resource]}!"
 
         elif event == TimelineEvent.TIMELINE_SHIFT:
             # Shuffle timelines
@@ -598,12 +766,13 @@ class KuantumKitchen:
                 all_orders.extend(orders)
 
             # Reset timelines
-            self.timelines = defaultdict(list)
+            self._reset_timelines()
 
             # Reassign orders to random timelines
-            for order in all_orders:
-                order.timeline = random.randint(1, min(2 + self.day // 3, 5))
-                self.timelines[order.timeline].append(order)
+            new_timelines = random.choices(range(1, self._day_params.timeline_count + 1), k=len(all_orders))
+            for order, timeline in zip(all_orders, new_timelines):
+                order.timeline = timeline
+                self._add_to_timeline(order)
 
             message += " All orders have shifted to different timelines!"
 
@@ -611,7 +780,7 @@ class KuantumKitchen:
             # Randomly change the state of one order
             if self.active_orders:
                 order = random.choice(self.active_orders)
-                if order.state == OrderState.SUPERPOSITION:
+                if order.state is OrderState.SUPERPOSITION:
                     order.time_remaining = min(order.time_limit, order.time_remaining + 2)
                     message += f" Order #{order.id} gained 2 time units!"
 
@@ -624,34 +793,25 @@ class KuantumKitchen:
         return message
 
     def get_status(self):
-        status = [
-            f"===== KUANTUM KITCHEN - DAY {self.day} =====",
-            f"Phase: {self.current_phase}",
-            f"Score: {self.score}",
-            f"Customer Satisfaction: {self.customer_satisfaction}%",
-            f"Reality Stability: {self.reality_stability}%",
-            "",
-            "Resources:",
-        ]
-
-        for resource, amount in self.resources.items():
-            status.append(f"  {resource.value}: {amount}")
+        resources = "\n".join(f"  {name}: {amount}" for name, amount in zip(_RESOURCE_NAMES, self.resources))
+        events = ""
+        if self.special_events:
+            events = "\nActive Events:\n" + "\n".join(f"  {event.value}" for event in self.special_events) + "\n"
 
-        status.append("")
-        status.append(
-            f"Kitchen Units: {', '.join([f'{unit} (x{count})' for unit, count in self.kitchen_units.items()])}")
-        status.append("")
+        return f"""===== KUANTUM KITCHEN - DAY {self.day} =====
+Phase: {self.current_phase}
+Score: {self.score}
+Customer Satisfaction: {self.customer_satisfaction}%
+Reality Stability: {self.reality_stability}%
 
-        if self.special_events:
-            status.append("Active Events:")
-            for event in self.special_events:
-                status.append(f"  {event.value}")
-            status.append("")
+Resources:
+{resources}
 
-        return "\n".join(status)
+{self._kitchen_units_line}
+{events}"""
 
     def show_tutorial(self):
-        os.system('cls' if os.name == 'nt' else 'clear')
+        _clear_screen()
         print("\n===== WELCOME TO KUANTUM KITCHEN =====")
         print("\nYou are the manager of a quantum kitchen where orders exist in superposition until observed!")
         print("\nGAME PHASES:")
@@ -670,9 +830,15 @@ class KuantumKitchen:
         print("- Probability Stabilizers: Increase chances of successful dishes")
         print("- Timeline Tokens: Help manage deliveries across multiple timelines")
 
-        input("\nPress ENTER to start your first day at Kuantum Kitchen...")
+        self._pause("\nPress ENTER to start your first day at Kuantum Kitchen...")
         self.tutorial_shown = True
 
+    def _pause(self, message="Press ENTER to continue..."):
+        # Wait for ENTER with one plain read; every pause in the game goes through here
+        sys.stdout.write(message)
+        sys.stdout.flush()
+        sys.stdin.readline()
+
     def check_game_over(self):
         # Game over if reality stability hits 0
         if self.reality_stability <= 0:
@@ -684,230 +850,174 @@ class KuantumKitchen:
 
         return False, ""
 
+    def _dispatch(self, command, handlers, prefix_handlers):
+        # Exact commands take no arguments; prefix commands get a 0-based order index, or None if it was left out.
+        # A handler returning anything but None ends the phase with that result
+        match = self._CMD_RE.fullmatch(command)
+        if match is not None:
+            verb, number = match.groups()
+            if number is None and verb in handlers:
+                return handlers[verb]()
+            if verb in prefix_handlers:
+                return prefix_handlers[verb](None if number is None else int(number) - 1)
+
+        # Anything else starting with a prefix command's letter gets that command's usage hint
+        handler = prefix_handlers.get(command[:1])
+        return handler(None) if handler else self._cmd_invalid()
+
+    def _cmd_invalid(self):
+        print("Invalid command.")
+        self._pause()
+
+    def _cmd_quit(self):
+        if input("Are you sure you want to quit? (y/n): ").lower() == 'y':
+            return False
+
+    def _run_order_command(self, order_idx, action, usage):
+        # Shared body of the a#/r#/p#/d# commands
+        if order_idx is None:
+            print(f"Invalid command format. {usage}")
+        else:
+            success, message = action(order_idx)
+            print(message)
+        self._pause()
+
+    def _show_order_details(self, orders, order_idx):
+        if order_idx is None:
+            print("Invalid command format. Use v# to view an order.")
+        elif 0 <= order_idx < len(orders):
+            print("\n" + orders[order_idx].get_details())
+        else:
+            print("Invalid order index.")
+        self._pause()
+
+    def _cmd_planning_next(self):
+        if not self.active_orders:
+            print("You must accept at least one order to proceed.")
+            self._pause()
+        else:
+            return True
+
+    def _cmd_accept(self, order_idx):
+        return self._run_order_command(order_idx, self.accept_order, "Use a# to accept an order.")
+
+    def _cmd_reject(self, order_idx):
+        return self._run_order_command(order_idx, self.reject_order, "Use r# to reject an order.")
+
+    def _cmd_view_available(self, order_idx):
+        self._show_order_details(self.available_orders, order_idx)
+
+    def _cmd_view_active(self, order_idx):
+        self._show_order_details(self.active_orders, order_idx)
+
+    def _cmd_exec_next(self):
+        if self._superposition_count == 0:
+            return True
+        else:
+            print("You must prepare all orders before proceeding.")
+            self._pause()
+
+    def _cmd_tick(self):
+        if self.update_time():
+            self._pause()
+
+    def _cmd_prepare(self, order_idx):
+        return self._run_order_command(order_idx, self.prepare_order, "Use p# to prepare an order.")
+
+    def _cmd_delivery_next(self):
+        if self.active_orders:
+            if input("You still have active orders. Are you sure you want to end the day? (y/n): ").lower() == 'y':
+                # Failed delivery penalty
+                self.customer_satisfaction = max(0, self.customer_satisfaction - 3 * len(self.active_orders))
+
+                self.active_orders.clear()
+                self._superposition_count = 0
+                self._reset_timelines()
+                return True
+        else:
+            return True
+
+    def _cmd_deliver(self, order_idx):
+        return self._run_order_command(order_idx, self.deliver_order, "Use d# to deliver an order.")
+
+    def _format_order_list(self, orders):
+        # Numbered order list as one block of lines
+        return "".join(f"[{i + 1}] {order}\n" for i, order in enumerate(orders))
+
+    def _format_timelines(self):
+        return "".join(f"Timeline {timeline}: Orders #{self._timeline_label(timeline)}\n" for timeline in sorted(self.timelines))
+
     def run_planning_phase(self):
         self.current_phase = "Planning"
         self.generate_orders()
 
         while True:
-            os.system('cls' if os.name == 'nt' else 'clear')
-            print(self.get_status())
-
-            print("\n===== AVAILABLE ORDERS =====")
+            frame = [_CLEAR, self.get_status(), "\n\n===== AVAILABLE ORDERS =====\n"]
             if not self.available_orders:
-                print("No more orders available.")
+                frame.append("No more orders available.\n")
             else:
-                for i, order in enumerate(self.available_orders):
-                    print(f"[{i + 1}] {order}")
+                frame.append(self._format_order_list(self.available_orders))
 
-            print("\n===== ACTIVE ORDERS =====")
+            frame.append("\n===== ACTIVE ORDERS =====\n")
             if not self.active_orders:
-                print("No active orders.")
+                frame.append("No active orders.\n")
             else:
-                for i, order in enumerate(self.active_orders):
-                    print(f"[{i + 1}] {order}")
+                frame.append(self._format_order_list(self.active_orders))
 
-            print("\n===== PLANNING PHASE COMMANDS =====")
-            print("[a#] Accept order # (e.g., a1)")
-            print("[r#] Reject order # (e.g., r1)")
-            print("[v#] View order details # (e.g., v1)")
-            print("[n] Proceed to Execution Phase")
-            print("[q] Quit game")
+            frame.append(self._PLANNING_COMMANDS)
+            _write_frame(frame)
 
             command = input("\nEnter command: ").strip().lower()
-
-            if command == 'q':
-                if input("Are you sure you want to quit? (y/n): ").lower() == 'y':
-                    return False
-            elif command == 'n':
-                if not self.active_orders:
-                    print("You must accept at least one order to proceed.")
-                    input("Press ENTER to continue...")
-                else:
-                    return True
-            elif command.startswith('a'):
-                try:
-                    order_idx = int(command[1:]) - 1
-                    success, message = self.accept_order(order_idx)
-                    print(message)
-                    input("Press ENTER to continue...")
-                except (ValueError, IndexError):
-                    print("Invalid command format. Use a# to accept an order.")
-                    input("Press ENTER to continue...")
-            elif command.startswith('r'):
-                try:
-                    order_idx = int(command[1:]) - 1
-                    success, message = self.reject_order(order_idx)
-                    print(message)
-                    input("Press ENTER to continue...")
-                except (ValueError, IndexError):
-                    print("Invalid command format. Use r# to reject an order.")
-                    input("Press ENTER to continue...")
-            elif command.startswith('v'):
-                try:
-                    if command[1] == 'a':  # View active order
-                        order_idx = int(command[2:]) - 1
-                        if 0 <= order_idx < len(self.active_orders):
-                            print("\n" + self.active_orders[order_idx].get_details())
-                        else:
-                            print("Invalid order index.")
-                    else:  # View available order
-                        order_idx = int(command[1:]) - 1
-                        if 0 <= order_idx < len(self.available_orders):
-                            print("\n" + self.available_orders[order_idx].get_details())
-                        else:
-                            print("Invalid order index.")
-                    input("Press ENTER to continue...")
-                except (ValueError, IndexError):
-                    print("Invalid command format. Use v# to view an order.")
-                    input("Press ENTER to continue...")
-            else:
-                print("Invalid command.")
-                input("Press ENTER to continue...")
+            result = self._dispatch(command, self._planning_handlers, self._planning_prefix)
+            if result is not None:
+                return result
 
     def run_execution_phase(self):
         self.current_phase = "Execution"
 
         while True:
-            os.system('cls' if os.name == 'nt' else 'clear')
-            print(self.get_status())
-
-            print("\n===== ACTIVE ORDERS =====")
+            frame = [_CLEAR, self.get_status(), "\n\n===== ACTIVE ORDERS =====\n"]
             if not self.active_orders:
-                print("No active orders. All orders have been prepared!")
-                input("Press ENTER to continue to Delivery Phase...")
+                frame.append("No active orders. All orders have been prepared!\n")
+                _write_frame(frame)
+                self._pause("Press ENTER to continue to Delivery Phase...")
                 return True
-            else:
-                for i, order in enumerate(self.active_orders):
-                    print(f"[{i + 1}] {order}")
-
-            print("\n===== TIMELINES =====")
-            for timeline, orders in sorted(self.timelines.items()):
-                if orders:
-                    order_ids = [str(order.id) for order in orders]
-                    print(f"Timeline {timeline}: Orders #{', #'.join(order_ids)}")
-
-            print("\n===== EXECUTION PHASE COMMANDS =====")
-            print("[p#] Prepare order # (e.g., p1)")
-            print("[v#] View order details # (e.g., v1)")
-            print("[t] Update time (advances time by 1 unit)")
-            print("[n] Proceed to Delivery Phase")
-            print("[q] Quit game")
 
-            command = input("\nEnter command: ").strip().lower()
+            frame.append(self._format_order_list(self.active_orders))
+            frame.append("\n===== TIMELINES =====\n")
+            frame.append(self._format_timelines())
+            frame.append(self._EXECUTION_COMMANDS)
+            _write_frame(frame)
 
-            if command == 'q':
-                if input("Are you sure you want to quit? (y/n): ").lower() == 'y':
-                    return False
-            elif command == 'n':
-                ready_to_proceed = True
-                for order in self.active_orders:
-                    if order.state == OrderState.SUPERPOSITION:
-                        ready_to_proceed = False
-                        break
-
-                if ready_to_proceed:
-                    return True
-                else:
-                    print("You must prepare all orders before proceeding.")
-                    input("Press ENTER to continue...")
-            elif command == 't':
-                if self.update_time():
-                    input("Press ENTER to continue...")
-            elif command.startswith('p'):
-                try:
-                    order_idx = int(command[1:]) - 1
-                    success, message = self.prepare_order(order_idx)
-                    print(message)
-                    input("Press ENTER to continue...")
-                except (ValueError, IndexError):
-                    print("Invalid command format. Use p# to prepare an order.")
-                    input("Press ENTER to continue...")
-            elif command.startswith('v'):
-                try:
-                    order_idx = int(command[1:]) - 1
-                    if 0 <= order_idx < len(self.active_orders):
-                        print("\n" + self.active_orders[order_idx].get_details())
-                    else:
-                        print("Invalid order index.")
-                    input("Press ENTER to continue...")
-                except (ValueError, IndexError):
-                    print("Invalid command format. Use v# to view an order.")
-                    input("Press ENTER to continue...")
-            else:
-                print("Invalid command.")
-                input("Press ENTER to continue...")
+            command = input("\nEnter command: ").strip().lower()
+            result = self._dispatch(command, self._exec_handlers, self._exec_prefix)
+            if result is not None:
+                return result
 
     def run_delivery_phase(self):
         self.current_phase = "Delivery"
 
         while True:
-            os.system('cls' if os.name == 'nt' else 'clear')
-            print(self.get_status())
-
-            print("\n===== ACTIVE ORDERS =====")
+            frame = [_CLEAR, self.get_status(), "\n\n===== ACTIVE ORDERS =====\n"]
             if not self.active_orders:
-                print("No active orders. All orders have been delivered!")
-                input("Press ENTER to continue to the next day...")
+                frame.append("No active orders. All orders have been delivered!\n")
+                _write_frame(frame)
+                self._pause("Press ENTER to continue to the next day...")
                 return True
-            else:
-                for i, order in enumerate(self.active_orders):
-                    print(f"[{i + 1}] {order}")
 
-            print("\n===== TIMELINES =====")
-            for timeline, orders in sorted(self.timelines.items()):
-                if orders:
-                    order_ids = [str(order.id) for order in orders]
-                    print(f"Timeline {timeline}: Orders #{', #'.join(order_ids)}")
-
-            print("\n===== DELIVERY PHASE COMMANDS =====")
-            print("[d#] Deliver order # (e.g., d1)")
-            print("[v#] View order details # (e.g., v1)")
-            print("[n] End day and proceed to next day")
-            print("[q] Quit game")
+            frame.append(self._format_order_list(self.active_orders))
+            frame.append("\n===== TIMELINES =====\n")
+            frame.append(self._format_timelines())
+            frame.append(self._DELIVERY_COMMANDS)
+            _write_frame(frame)
 
             command = input("\nEnter command: ").strip().lower()
-
-            if command == 'q':
-                if input("Are you sure you want to quit? (y/n): ").lower() == 'y':
-                    return False
-            elif command == 'n':
-                if self.active_orders:
-                    if input("You still have active orders. Are you sure you want to end the day? (y/n): ").lower() == 'y':
-                        # Failed delivery penalty
-                        for order in self.active_orders:
-                            self.customer_satisfaction = max(0, self.customer_satisfaction - 3)
-
-                        self.active_orders = []
-                        self.timelines = defaultdict(list)
-                        return True
-                else:
-                    return True
-            elif command.startswith('d'):
-                try:
-                    order_idx = int(command[1:]) - 1
-                    success, message = self.deliver_order(order_idx)
-                    print(message)
-                    input("Press ENTER to continue...")
-                except (ValueError, IndexError):
-                    print("Invalid command format. Use d# to deliver an order.")
-                    input("Press ENTER to continue...")
-            elif command.startswith('v'):
-                try:
-                    order_idx = int(command[1:]) - 1
-                    if 0 <= order_idx < len(self.active_orders):
-                        print("\n" + self.active_orders[order_idx].get_details())
-                    else:
-                        print("Invalid order index.")
-                    input("Press ENTER to continue...")
-                except (ValueError, IndexError):
-                    print("Invalid command format. Use v# to view an order.")
-                    input("Press ENTER to continue...")
-            else:
-                print("Invalid command.")
-                input("Press ENTER to continue...")
+            result = self._dispatch(command, self._delivery_handlers, self._delivery_prefix)
+            if result is not None:
+                return result
 
     def show_game_summary(self):
-        os.system('cls' if os.name == 'nt' else 'clear')
+        _clear_screen()
         print("\n===== KUANTUM KITCHEN SUMMARY =====")
         print(f"Days Survived: {self.day}")
         print(f"Final Score: {self.score}")
@@ -917,14 +1027,12 @@ class KuantumKitchen:
         print(f"Orders Failed: {len(self.failed_orders)}")
 
         print("\nTop 5 Best Orders:")
-        best_orders = sorted(self.completed_orders,
-                             key=lambda o: o.actual_outcome["satisfaction"] if o.actual_outcome else 0,
-                             reverse=True)[:5]
+        best_orders = heapq.nlargest(5, self.completed_orders, key=attrgetter('_satisfaction'))
         for i, order in enumerate(best_orders):
             if order.actual_outcome:
                 print(f"{i + 1}. Order #{order.id}: {order.dish.value} - {order.actual_outcome['description']} ({order.actual_outcome['satisfaction']}%)")
 
-        input("\nPress ENTER to exit...")
+        self._pause("\nPress ENTER to exit...")
 
     def run_game(self):
         if not self.tutorial_shown:
@@ -939,7 +1047,7 @@ class KuantumKitchen:
             game_over, reason = self.check_game_over()
             if game_over:
                 print(reason)
-                input("Press ENTER to continue...")
+                self._pause()
                 break
 
             # Run phases of the day
@@ -953,7 +1061,7 @@ class KuantumKitchen:
         # Check if the player survived all 7 days (win)
         if self.day > 7:
             print("Congratulations! You have survived 7 days in Kuantum Kitchen!")
-            input("Press ENTER to continue...")
+            self._pause()
 
         self.show_game_summary()
 